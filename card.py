@@ -9,16 +9,18 @@ class CardColor:
     :ivar str hex: hex color code of the card in the UI
     """
 
-    def __init__(self, name: str, color: str | Iterable[int, int, int] | Iterable[int, int, int, int]):
+    __slots__ = ('name', 'hex')
+
+    def __init__(self, name: str, color: str | tuple[int, int, int] | tuple[int, int, int, int]):
         """
         Color class constructor
         :param name: color name
         :param color: displayed hex, RGB, or RGBA color
         """
-        if isinstance(color, str):
+        if type(color) is str:
             self.hex: str = color
         else:
-            self.hex: str = f"#{''.join([hex(i)[:2] for i in color])}"
+            self.hex: str = ('#%02x%02x%02x' if len(color) == 3 else '#%02x%02x%02x%02x') % tuple(color)
 
         self.name: str = name
 
@@ -26,10 +28,13 @@ class CardColor:
         return self.name
 
     def __eq__(self, other):
+        if type(other) is CardColor:
+            # card colors are shared instances
+            return self is other
         return self.name == str(other)
 
     def __hash__(self):
-        return
+        return hash(self.name)
 
 
 class CardType:
@@ -42,8 +47,12 @@ class CardType:
     :ivar isWild: if the card is a wildcard
     :ivar isSkip: if the card will skip the next player
     :ivar isReverse: if the card will reverse the turn order
+    :ivar isNumber: if the card is a number card
+    :ivar value: the number on the card, or ``None`` if it is not a number card
     """
 
+    __slots__ = ('name', 'imagePath', 'isReverse', 'drawAmount', 'isSkip', 'isWild', 'isNumber', 'value')
+
     def __init__(self, name: str, drawAmount: int = 0, isWild: bool = False, isSkip: bool = False,
                  isReverse: bool = False, imagePath: str = None):
         """
@@ -62,54 +71,62 @@ class CardType:
         self.drawAmount: int = drawAmount
         self.isSkip: bool = isSkip
         self.isWild: bool = isWild
+        self.isNumber: bool = name.isdigit()
+        self.value: int | None = int(name) if self.isNumber else None
 
     def __hash__(self):
-        if self.name.isdigit():
-            return int(self.name)
+        if self.value is not None:
+            return self.value
         return 10 + self.isReverse + 2*self.isSkip + 4*self.isWild + 8*self.drawAmount
 
     def __str__(self):
         return self.name
 
     def __eq__(self, other):
+        if type(other) is CardType:
+            # card types are shared instances
+            return self is other
         return self.name == str(other)
 
     def __and__(self, other):
-        return self.isWild or self.name == str(other)
+        if type(other) is CardType:
+            # card types are shared instances
+            return self.isWild or other.isWild or self is other
+        return self.isWild or self == other
 
     def __add__(self, other):
-        if self.name.isdigit() and other.name.isdigit():
-            return int(self.name) + int(other.name)
+        if self.value is not None and other.value is not None:
+            return self.value + other.value
         else:
             return None
 
     def __sub__(self, other):
-        if self.name.isdigit() and other.name.isdigit():
-            return int(self.name) - int(other.name)
+        if self.value is not None and other.value is not None:
+            return self.value - other.value
         else:
             return None
 
     def __lt__(self, other):
-        if self.name.isdigit() and other.name.isdigit():
-            return int(self.name) < int(other.name)
+        if self.value is not None and other.value is not None:
+            return self.value < other.value
         else:
             return None
 
     def __gt__(self, other):
-        if self.name.isdigit() and other.name.isdigit():
-            return int(self.name) > int(other.name)
+        if self.value is not None and other.value is not None:
+            return self.value > other.value
         else:
             return None
 
     def __le__(self, other):
-        if self.name.isdigit() and other.name.isdigit():
-            return int(self.name) <= int(other.name)
+        if self.value is not None and other.value is not None:
+            return self.value <= other.value
         else:
             return None
 
     def __ge__(self, other):
-        if self.name.isdigit() and other.name.isdigit():
-            return int(self.name) >= int(other.name)
+        if self.value is not None and other.value is not None:
+            return self.value >= other.value
         else:
             return None
 
@@ -120,12 +137,18 @@ class Card:
 
     :cvar dict[str, CardColor] COLORS: maps color names to the corresponding card colors
     :cvar dict[str, CardType] ACTION_CARDS: maps type names to the corresponding action card type
+    :cvar dict[str, CardType] NUMBER_CARDS: maps digits to the corresponding number card type
+    :cvar dict[str, int] COLOR_INDICES: maps color names to their index in ``COLORS``
 
     :ivar CardColor color: card color
     :ivar CardType type: card type
-    :ivar int ruleAdditions: number of rules the player can add after playing this card
+    :ivar frozenset[int] ruleAdditions: numbers of rules the player can add after playing this card
+    :ivar int code: the card's color index in the high bits and its type's hash in the low 8 bits. Cards with the
+    same color and type have the same code.
     """
 
+    __slots__ = ('color', 'type', 'ruleAdditions', 'code')
+
     # static class attributes
 
     # card colors
@@ -137,6 +160,8 @@ class Card:
         'blue': CardColor('blue', '#0060ff')
     }
 
+    COLOR_INDICES = {name: i for i, name in enumerate(COLORS)}
+
     ACTION_CARDS = {
         'skip': CardType('skip', isSkip=True),
         'reverse': CardType('reverse', isReverse=True),
@@ -145,6 +170,8 @@ class Card:
         'wild': CardType('wild', isWild=True),
     }
 
+    NUMBER_CARDS = {str(i): CardType(str(i)) for i in range(10)}
+
     def __init__(self, color: str | CardColor, cardType: int | str,
                  ruleAdditions: int | Iterable[int] = 0):
         """
@@ -156,27 +183,26 @@ class Card:
         iterable is provided, it allows for the player to add varying amounts of rules.
         """
 
-        # set card color
         self.color = None
-        self.set_color(color)
+        self.type = None
 
         # set card type
-        self.type = None
         self.set_type(cardType)
 
+        # set card color
+        self.set_color(color)
+
         # set card rule additions
-        if isinstance(ruleAdditions, int):
-            self.ruleAdditions = {ruleAdditions}
-        elif isinstance(ruleAdditions, Iterable):
-            assert all(map(lambda numRules: isinstance(numRules, int), ruleAdditions))
-            self.ruleAdditions = set(ruleAdditions)
+        if type(ruleAdditions) is int:
+            self.ruleAdditions = frozenset((ruleAdditions,))
+        else:
+            self.ruleAdditions = frozenset(ruleAdditions)
 
     def __eq__(self, other):
         """Determines if 2 cards are identical"""
-        if isinstance(other, Card):
-            return self.type == other.type and self.color == other.color \
-                and self.ruleAdditions == other.ruleAdditions
-        elif isinstance(other, str):
+        if type(other) is Card:
+            return self.code == other.code and self.ruleAdditions == other.ruleAdditions
+        elif type(other) is str:
             return self.color.name == other or self.type.name == other
         else:
             return False
@@ -188,11 +214,11 @@ class Card:
         return self.__str__()
 
     def __hash__(self):
-        return hash(self.type) + 128 * ['wild', 'red', 'yellow', 'green', 'blue'].index(self.color.name)
+        return self.code
 
     def __and__(self, other):
         """Determines if 2 cards are compatible"""
-        return self.color == other.color or (self.type and other.type)
+        return self.type.isWild or other.type.isWild or self.color is other.color or self.type is other.type
 
     def __add__(self, other):
         return self.type + other.type
@@ -214,28 +240,26 @@ class Card:
 
     def set_color(self, color: str | CardColor) -> None:
         """
-        Sets the card's color.
+        Sets the card's color. Also used to pick the color of a played wild card.
         :param color: the card's color. Can be 'wild', 'red', 'yellow', 'green', or 'blue'
         """
-        if isinstance(color, CardColor):
+        if type(color) is CardColor:
             self.color = color
         else:
-            assert (isinstance(color, str))  # ensure color is a string
-            if self.type.isWild:
-                self.color.name = color
-            else:
-                try:
-                    self.color = Card.COLORS[color]
-                except KeyError:
-                    raise ValueError(f"'{color}' is not a valid card color. Valid card colors include 'wild', 'red', "
-                                     f"'yellow', 'green', and 'blue'")
+            assert (type(color) is str)  # ensure color is a string
+            # wild cards take on the shared color too. Renaming their color would rename it for every card.
+            self.color = Card.COLORS.get(color)
+            if self.color is None:
+                raise ValueError(f"'{color}' is not a valid card color. Valid card colors include 'wild', 'red', "
+                                 f"'yellow', 'green', and 'blue'")
+        self._update_code()
 
     def is_dupe(self, other):
         """
         similar to Card == other, but ignores ruleAdditions
         other: another Card
         """
-        return self.type == other.type and self.color == other.color
+        return self.code == other.code
 
     def set_type(self, cardType: str | CardType) -> None:
         """
@@ -243,15 +267,19 @@ class Card:
         :param cardType: The type of card. Use 0-9 for a number card. Use 'skip', 'reverse', 'draw 2', 'wild draw 4',
         or 'wild' for the respective action cards
         """
-        if isinstance(cardType, CardType):
+        if type(cardType) is CardType:
             self.type = cardType
         else:
             cardType = str(cardType)
-            if cardType.isdigit():
-                self.type = CardType(cardType)
-            else:
-                try:
-                    self.type = Card.ACTION_CARDS[cardType]
-                except KeyError:
+            self.type = Card.NUMBER_CARDS.get(cardType)
+            if self.type is None:
+                self.type = Card.ACTION_CARDS.get(cardType)
+                if self.type is None:
                     raise ValueError(f"'{cardType}' is not a valid card type. Valid card types include digits 0-9, "
-                                     f"'reverse', 'skip', 'draw 2', 'wild draw 4', and 'wild'.")
\ No newline at end of file
+                                     f"'reverse', 'skip', 'draw 2', 'wild draw 4', and 'wild'.")
+        self._update_code()
+
+    def _update_code(self) -> None:
+        """Recomputes the card's code after its color or type changed"""
+        if self.color is not None and self.type is not None:
+            self.code = (Card.COLOR_INDICES[self.color.name] << 8) | hash(self.type)
\ No newline at end of file
@@ -3,20 +3,52 @@ from card import Card
 import random
 
 
+def _build_default_deck() -> tuple[list[Card], list[tuple[Card, Card]]]:
+    """
+    Builds the colored cards of a full deck once, so that Deck.fill only has to copy and shuffle them.
+    :return: the colored cards that never carry rules, and a (normal, rule card) pair for each of the 72 number cards
+    that may carry rules
+    """
+    fixedCards: list[Card] = []
+    numberCards: list[tuple[Card, Card]] = []
+
+    colors = ['red', 'yellow', 'green', 'blue']
+    actionCards = ['reverse', 'skip', 'draw 2'] * 2
+    numbers = [0] + list(range(1, 9)) * 2 + [9]
+
+    for color in colors:
+        for cardType in actionCards:
+            fixedCards.append(Card(color, cardType, 0))
+
+        fixedCards.append(Card(color, 0, 2))
+        fixedCards.append(Card(color, 9, 0))
+
+        for i in numbers:
+            numberCards.append((Card(color, i, 0), Card(color, i, 2 if i == 0 else 1)))
+
+    return fixedCards, numberCards
+
+
+_FIXED_CARDS, _NUMBER_CARDS = _build_default_deck()
+
+
 class Deck:
     """UNO Deck class"""
 
-    def __init__(self, cards: list[Card] | str = 'default', maxCards: int = 112):
+    def __init__(self, cards: list[Card] | str = 'default', maxCards: int = 112, rng: random.Random | None = None):
         """UNO Deck class constructor
         :param cards: the cards currently in the deck. Use 'default' for a full deck, 'empty' for an empty deck
         :param maxCards: maximum number of cards in the deck (for performance)
+        :param rng: random number generator used for shuffling. A new unseeded one is made if not provided.
         """
-        if cards == 'default':
+        self.rng: random.Random = random.Random() if rng is None else rng
+
+        if type(cards) is not str:
+            self.cards = cards
+        elif cards == 'default':
             self.fill()
         elif cards == 'empty':
             self.cards = []
-        else:
-            self.cards = cards
 
         self.maxCards = maxCards
 
@@ -42,32 +74,19 @@ class Deck:
         4 Wild Draw 4 cards
         4 Wild rule cards
         """
-        self.cards: list[Card] = [wild for wild in [Card('wild', 'wild', 0),
-                                                    Card('wild', 'wild', range(1, 4)),
-                                                    Card('wild', 'wild draw 4', 0)] for _ in range(3)]
-
-        colors = ['red', 'yellow', 'green', 'blue']
-        actionCards = ['reverse', 'skip', 'draw 2'] * 2
+        # wild cards get recolored when played, so every copy is its own instance
+        self.cards: list[Card] = [wild for _ in range(3) for wild in (Card('wild', 'wild', 0),
+                                                                      Card('wild', 'wild', range(1, 4)),
+                                                                      Card('wild', 'wild draw 4', 0))]
+        self.cards += _FIXED_CARDS
 
-        ruleIndices = random.sample(range(0, 72), 20)
-        numbers = [0] + list(range(1, 9)) * 2 + [9]
-        index = 0
+        # 20 of the 72 number cards carry rules
+        hasRules = [True] * 20 + [False] * 52
+        self.rng.shuffle(hasRules)
 
-        for color in colors:
-            for cardType in actionCards:
-                self.cards.append(Card(color, cardType, 0))
+        self.cards += [ruleCard if rule else card for (card, ruleCard), rule in zip(_NUMBER_CARDS, hasRules)]
 
-            self.cards.append(Card(color, 0, 2))
-            self.cards.append(Card(color, 9, 0))
-
-            for i in numbers:
-                if index in ruleIndices:
-                    self.cards.append(Card(color, i, 2 if i == 0 else 1))
-                else:
-                    self.cards.append(Card(color, i, 0))
-                index += 1
-
-        random.shuffle(self.cards)
+        self.rng.shuffle(self.cards)
 
     def deal(self, n: int) -> list[Card]:
         """
@@ -76,27 +95,38 @@ class Deck:
         :return: a list of the cards drawn
         """
         drawn = []
+        self.deal_into(drawn, n)
+        return drawn
+
+    def deal_into(self, out: list[Card], n: int) -> None:
+        """
+        deals n cards from the top of the deck straight onto the end of a list, such as a player's hand
+        :param out: the list receiving the cards
+        :param n: number of cards to draw
+        """
+        while n > 0:
+            # take as many cards as possible off the top at once, refilling the deck when it runs out
+            taken = self.cards[-n:]
+            del self.cards[-n:]
+            out += taken
+            n -= len(taken)
 
-        for _ in range(n):
-            drawn.append(self.cards.pop())
             if not self.cards:
                 self.fill()
 
-        return drawn
-
     def append(self, cards: Card | list[Card]) -> None:
         """
         Appends cards to the deck
         :param cards: the card(s) to append.
         """
-        if isinstance(cards, list):
+        if type(cards) is list:
             self.cards += cards
         else:
             self.cards.append(cards)
 
         # delete bottom cards if there's too many
         if len(self.cards) > self.maxCards:
-            self.cards = self.cards[-self.maxCards:]
+            del self.cards[:-self.maxCards]
 
     def get_top(self) -> Card | None:
         """
@@ -110,13 +140,13 @@ class Deck:
         Gets the sum of the top two cards if they are both number cards
         :return: the sum of the top two cards if they are both number cards, None otherwise.
         """
-        type1 = self.cards[-1].type.name
-        type2 = self.cards[-2].type.name
-
-        if type1.isdigit() and type2.isdigit():
-            return int(type1) + int(type2)
-        else:
+        if len(self.cards) < 2:
             return None
 
+        value1 = self.cards[-1].type.value
+        value2 = self.cards[-2].type.value
 
-
+        if value1 is not None and value2 is not None:
+            return value1 + value2
+        else:
+            return None
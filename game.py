@@ -1,4 +1,6 @@
 import random
+from collections import deque
+from typing import Callable
 
 from player import Player
 from card import Card
@@ -11,30 +13,55 @@ from rule_cards import *
 class Game:
     """Total Chaos UNO Game class"""
 
-    def __init__(self, players: list[str], eternalChaos: bool = False):
+    __slots__ = ('rng', 'drawPile', 'discard', '_discardHeight', 'players', 'numPlayers', 'toMove', 'direction',
+                 'stateVersion',
+                 '_nextForward', '_nextBackward', '_nextTable',
+                 'totalChaos', 'stacking', 'slapJacks', 'swappyZero', 'swappySeven', 'depleters',
+                 'attackMultiplier', 'drawToPlay', 'revives', 'jumpIns', 'mathRules', 'silentSixes', 'rules',
+                 'moveRules', 'ruleDeck', 'ruleDiscard', 'ruleSlots', 'ruleChooser')
+
+    def __init__(self, players: list[str], eternalChaos: bool = False, seed: int | None = None,
+                 ruleChooser: Callable[[RuleSlot], int] | None = None):
         """
         Total Chaos UNO Game class constructor
         :param players: list of players
         :param eternalChaos: determines whether eternal chaos mode is on
+        :param seed: seed for all the game's shuffling, so games can be replayed. Leave as None for a random game.
+        :param ruleChooser: picks the index of a rule card in a slot, e.g. for revives. Leave as None to ask the
+        player.
         """
+        # one generator per game instead of the shared module-level one
+        self.rng: random.Random = random.Random(seed)
+
+        self.ruleChooser: Callable[[RuleSlot], int] | None = ruleChooser
+
+        # incremented whenever something changes that can affect players' legal moves
+        self.stateVersion: int = 0
 
         # draw and discard piles
-        self.drawPile: Deck = Deck()
+        self.drawPile: Deck = Deck(rng=self.rng)
         self.discard: Deck = Deck('empty', maxCards=2)
         self.discard.append(self.drawPile.deal(1))
         self._discardHeight = 1
 
         # player list
-        random.shuffle(players)
+        self.rng.shuffle(players)
         self.players: list[Player] = [Player(name, self, i) for i, name in enumerate(players)]
         self.numPlayers: int = len(players)
 
-        for i in range(self.numPlayers):
-            self.players[i].draw(7)
+        # deal everyone's starting hand at once
+        dealt = self.drawPile.deal(7 * self.numPlayers)
+        for i, player in enumerate(self.players):
+            player.draw(dealt[7 * i:7 * (i + 1)])
 
         self.toMove: int = 0
         self.direction: int = 1
 
+        # next player to move from each seat in both directions
+        self._nextForward: tuple[int, ...] = tuple((i + 1) % self.numPlayers for i in range(self.numPlayers))
+        self._nextBackward: tuple[int, ...] = tuple((i - 1) % self.numPlayers for i in range(self.numPlayers))
+        self._nextTable: tuple[int, ...] = self._nextForward
+
         # rules
         self.totalChaos: bool = eternalChaos
 
@@ -63,6 +90,9 @@ class Game:
             'math': self.mathRules,
             'silent 6s': self.silentSixes
         }
+        # rules that can add moves, checked every time a player's legal moves are updated
+        self.moveRules: tuple[MoveRule, ...] = tuple(rule for rule in self.rules.values()
+                                                     if isinstance(rule, MoveRule))
         self.ruleDeck: list[RuleCard | RuleSlot] = []
         self.ruleDiscard: RuleSlot = RuleSlot([], False)
         self.ruleSlots: list[RuleSlot] = []
@@ -92,82 +122,94 @@ class Game:
             - total chaos
         """
         self.totalChaos = False
-        self.ruleDeck = [RuleSlot(None, True) for _ in range(4)] + \
-                        [SlotRemover(self, False) for _ in range(5)] + \
-                        [ReviveCard(self, 'slot') for _ in range(2)] + \
-                        [ReviveCard(self, 'discard') for _ in range(2)] + \
-                        [RuleCard(self, 'jump-ins') for _ in range(2)] + \
-                        [StackingCard(self, 'stacking (classical)', 'draw same') for _ in range(2)] + \
-                        [StackingCard(self, 'stacking (total chaos)', 'draw any') for _ in range(2)] + \
-                        [StackingCard(self, 'no u', 'reverse')] + \
-                        [StackingCard(self, 'delayed blast', 'skip')] + \
-                        [MathCard(self, 'dos', 'addition')] + \
-                        [MathCard(self, 'makes a difference', 'subtraction')] + \
-                        [MultiplierCard(self, 'half attack', 0.5)] + \
-                        [MultiplierCard(self, 'double attack', 2)] + \
-                        [RuleCard(self, 'depleters')] + \
-                        [RuleCard(self, 'draw to play')] + \
-                        [RuleCard(self, 'slap jacks')] + \
-                        [RuleCard(self, 'silent 6s')] + \
-                        [RuleCard(self, 'swappy 0')] + \
-                        [RuleCard(self, 'swappy 7')]
-
-        random.shuffle(self.ruleDeck)
+        self.stateVersion += 1
+        self.ruleDeck = [RuleSlot(None, True) for _ in range(4)]
+        self.ruleDeck.extend(SlotRemover(self, False) for _ in range(5))
+        self.ruleDeck.extend(ReviveCard(self, 'slot') for _ in range(2))
+        self.ruleDeck.extend(ReviveCard(self, 'discard') for _ in range(2))
+        self.ruleDeck.extend(RuleCard(self, 'jump-ins') for _ in range(2))
+        self.ruleDeck.extend(StackingCard(self, 'stacking (classical)', 'draw same') for _ in range(2))
+        self.ruleDeck.extend(StackingCard(self, 'stacking (total chaos)', 'draw any') for _ in range(2))
+        self.ruleDeck.extend([
+            StackingCard(self, 'no u', 'reverse'),
+            StackingCard(self, 'delayed blast', 'skip'),
+            MathCard(self, 'dos', 'addition'),
+            MathCard(self, 'makes a difference', 'subtraction'),
+            MultiplierCard(self, 'half attack', 0.5),
+            MultiplierCard(self, 'double attack', 2),
+            RuleCard(self, 'depleters'),
+            RuleCard(self, 'draw to play'),
+            RuleCard(self, 'slap jacks'),
+            RuleCard(self, 'silent 6s'),
+            RuleCard(self, 'swappy 0'),
+            RuleCard(self, 'swappy 7')
+        ])
+
+        self.rng.shuffle(self.ruleDeck)
         self.ruleDeck.insert(0, TotalChaosCard(self))
         self.ruleSlots = [RuleSlot(self.ruleDeck.pop()) for _ in range(3)]
 
-    def draw_rule(self, slot: RuleSlot | int | None = None) -> None:
+    def draw_rule(self, slot: RuleSlot | int | None = None, **kwargs) -> None:
         """
         Draws a rule card and puts it into a slot
         :param slot: the rule slot object to add the rule to or the index of the rule slot.
         Leave as None if no slots are available.
+        :param kwargs: extra arguments for the drawn rule card's ``set_active``, e.g. ``reviveIndex``
         """
 
-        if isinstance(slot, int):
-            self.draw_rule(self.ruleSlots[slot])
-        elif slot is None:
-            self.draw_rule(self.ruleDiscard)
+        if self.totalChaos:
+            return
+
+        if slot is None:
+            slot = self.ruleDiscard
+        elif type(slot) is int:
+            slot = self.ruleSlots[slot]
+
+        self.stateVersion += 1
+        ruleCard = self.ruleDeck.pop()
+        if ruleCard.isSlot:
+            self.ruleSlots.append(ruleCard)  # extra slot
         else:
-            if not self.totalChaos:
-                ruleCard = self.ruleDeck.pop()
-                if isinstance(ruleCard, RuleCard):
-                    slot.append(ruleCard)  # new rule
-                else:
-                    self.ruleSlots.append(ruleCard)  # extra slot
+            slot.append(ruleCard, **kwargs)  # new rule
 
     def discard_slot(self, slot: RuleSlot | int) -> None:
         """
         Discards a rule slot.
         :param slot: the rule slot object to add the rule to or the index of the rule slot.
         """
+        self.stateVersion += 1
         if isinstance(slot, int):
             self.ruleDiscard += self.ruleSlots.pop(slot)
         else:
             self.ruleDiscard += slot
             self.ruleSlots.remove(slot)
 
-    def _apply_rules(self) -> None:
+    def _apply_rules(self, cardsPlayed: int) -> None:
         """
         applies active turn-based rules.
+        :param cardsPlayed: number of cards played this turn
         """
-        # stacking
-        self.stacking.update(self.drawPile, len(self.discard) - self._discardHeight)
+        # only rules that are in play need updating
+        if self.stacking.enabled:
+            self.stacking.update(self.discard, cardsPlayed)
 
-        # swappy rules
-        self.swappyZero.update(self)
-        self.swappySeven.update(self)
+        # swappy rules only react to the card on top
+        topValue = self.discard.get_top().type.value
+        if topValue == 0 and self.swappyZero.enabled:
+            self.swappyZero.update(self)
+        elif topValue == 7 and self.swappySeven.enabled:
+            self.swappySeven.update(self)
 
         # slap jacks
-        self.slapJacks.update(self.drawPile, self.players)
+        if self.slapJacks.enabled:
+            self.slapJacks.update(self.discard, self.players)
 
     def _apply_action_cards(self) -> None:
         """
         Applies action cards after a player moved
         :return:
         """
-        top = self.discard.get_top()
-        topType = top.type
-
+        topType = self.discard.get_top().type
         skip = topType.isSkip
 
         if topType.isReverse:
@@ -177,50 +219,56 @@ class Game:
                 skip = True
 
         # skip if needed
-        if skip and not (bool(self.stacking) and self.stacking.stackCount):
+        if skip and not (self.stacking.enabled and self.stacking.stackCount):
             self.next()
 
     def update(self) -> None:
         """
         Ends the current player's turn and all active rules take effect
         """
+        self.stateVersion += 1
+
         # check if the player played something (instead of drawing)
-        if len(self.discard) > self._discardHeight:
-            self._apply_rules()
+        discardHeight = len(self.discard)
+        if discardHeight > self._discardHeight:
+            self._apply_rules(discardHeight - self._discardHeight)
             self._apply_action_cards()
 
-        self.next()
-        self._discardHeight = len(self.discard)
+        # same as self.next(), inlined since this runs every turn
+        self.toMove = self._nextTable[self.toMove]
+        # applying rules and action cards never changes the discard pile
+        self._discardHeight = discardHeight
 
     def draw(self) -> None:
         """Player draws cards from deck after clicking on the deck"""
+        self.stateVersion += 1
         wasAttacked = self.stacking.stackCount > 0
         self.stacking.flush(self.players[self.toMove], self.attackMultiplier)
 
         # end player's turn if they received an attack or
-        if wasAttacked or not bool(self.drawToPlay):
+        if wasAttacked or not self.drawToPlay.enabled:
             self.next()
 
     def reverse(self) -> None:
         """Reverse turn order"""
         self.direction = -self.direction
+        self._nextTable = self._nextBackward if self._nextTable is self._nextForward else self._nextForward
 
     def next(self) -> None:
         """Next player"""
-        self.toMove = (self.toMove + self.direction) % self.numPlayers
+        self.toMove = self._nextTable[self.toMove]
 
     def cycle_hands(self) -> None:
         """Each player passes their hand to the next player"""
-        hand0 = self.players[0].hand
+        self.stateVersion += 1
+        hands = deque(player.hand for player in self.players)
+        hands.rotate(self.direction)
 
-        for i in range(0, -self.direction*(self.numPlayers-1), -self.direction):
-            self.players[i].hand = self.players[i-self.direction].hand
-
-        self.players[self.direction].hand = hand0
+        for player, hand in zip(self.players, hands):
+            player.hand = hand
 
     def trade_hands(self, player1: int, player2: int) -> None:
         """Two players trade hands"""
-        tmp = self.players[player1].hand
-        self.players[player1].hand = self.players[player2].hand
-        self.players[player2].hand = tmp
-
+        self.stateVersion += 1
+        players = self.players
+        players[player1].hand, players[player2].hand = players[player2].hand, players[player1].hand
@@ -1,3 +1,5 @@
+from collections import Counter
+
 from card import *
 
 
@@ -11,6 +13,9 @@ class Move:
     :ivar bool enforceMatch: whether another move must have all the same cards in order to be interchangeable
     """
 
+    __slots__ = ('middle', 'bottom', 'top', 'enforceMatch', '_bottomCodes', '_middleCodes', '_topCodes', '_codes',
+                 '_firstLayer', '_cards')
+
     def __init__(self,
                  middle: Card | list[Card] | set[Card] | None,
                  bottom: Card | list[Card] | set[Card] | None = None,
@@ -48,14 +53,46 @@ class Move:
 
         self.enforceMatch = enforceMatch
 
+        # the first non-empty layer
+        self._firstLayer: list[Card] = self.bottom or self.middle or self.top
+
+        # sets of (code, ruleAdditions) keys in each layer for comparing moves. The rule additions are part of the key
+        # because Card.__eq__ tells cards with different rule additions apart. Moves are never changed after
+        # construction.
+        self._bottomCodes: frozenset[tuple[int, frozenset[int]]] = frozenset([(card.code, card.ruleAdditions)
+                                                                              for card in self.bottom])
+        self._middleCodes: frozenset[tuple[int, frozenset[int]]] = frozenset([(card.code, card.ruleAdditions)
+                                                                              for card in self.middle])
+        self._topCodes: frozenset[tuple[int, frozenset[int]]] = frozenset([(card.code, card.ruleAdditions)
+                                                                           for card in self.top])
+        self._codes: frozenset[tuple[int, frozenset[int]]] = self._bottomCodes | self._middleCodes | self._topCodes
+
+        # set of the cards in the move, built the first time it is needed
+        self._cards: frozenset[Card] | None = None
+
     def __len__(self) -> int:
         return len(self.bottom) + len(self.middle) + len(self.top)
 
     def __getitem__(self, index) -> Card:
-        return self.tolist()[index]
+        if isinstance(index, slice):
+            return self.tolist()[index]
+
+        if index < 0:
+            index += len(self)
+
+        # index into the layers directly instead of concatenating them
+        for layer in (self.bottom, self.middle, self.top):
+            if 0 <= index < len(layer):
+                return layer[index]
+            index -= len(layer)
+
+        raise IndexError('move index out of range')
 
     def __contains__(self, item: Card) -> bool:
-        return item in self.tolist()
+        if type(item) is Card:
+            return item in self.toset()
+        # strings match cards by color or type name, which a set lookup can't do
+        return item in self.bottom or item in self.middle or item in self.top
 
     def __eq__(self, other) -> bool:
         """
@@ -63,8 +100,8 @@ class Move:
         :type other: Move
         :return: Returns True if the two moves are the same set, False if not
         """
-        return all([set(getattr(self, layer)) == set(getattr(other, layer)) for layer in ['bottom', 'middle', 'top']]) \
-            and len(self) == len(other)
+        return len(self) == len(other) and self._bottomCodes == other._bottomCodes \
+            and self._middleCodes == other._middleCodes and self._topCodes == other._topCodes
 
     def without(self, cards: list[Card], emptyOnInvalid: bool = False):
         """
@@ -74,19 +111,24 @@ class Move:
         :return: A version of the move without the cards in cards
         :rtype: Move
         """
-        bottom = self.bottom[:]
-        middle = self.middle[:]
-        top = self.top[:]
+        # count the cards to remove so each layer only has to be scanned once
+        toRemove = Counter(cards)
+
+        def remaining(layer: list[Card]) -> list[Card]:
+            kept = []
+            for card in layer:
+                if toRemove[card]:
+                    toRemove[card] -= 1
+                else:
+                    kept.append(card)
+            return kept
 
-        for card in cards:
-            if card in bottom:
-                bottom.remove(card)
-            elif card in middle:
-                middle.remove(card)
-            elif card in top:
-                top.remove(card)
-            elif emptyOnInvalid:
-                return Move([], enforceMatch=self.enforceMatch)
+        bottom = remaining(self.bottom)
+        middle = remaining(self.middle)
+        top = remaining(self.top)
+
+        if emptyOnInvalid and any(toRemove.values()):
+            return Move([], enforceMatch=self.enforceMatch)
 
         return Move(middle, bottom=bottom, top=top, enforceMatch=self.enforceMatch)
 
@@ -94,12 +136,7 @@ class Move:
         """
         :return: the first non-empty layer in the move
         """
-        if self.bottom:
-            return self.bottom
-        elif self.middle:
-            return self.middle
-        else:
-            return self.top
+        return self._firstLayer
 
     def can_replace(self, other) -> bool:
         """
@@ -111,13 +148,13 @@ class Move:
         # check if the move is a non-empty subset of the other move
         if self.__len__():
             if (self.enforceMatch or other.enforceMatch) and \
-                    not (self.toset() == other.toset() and len(self) == len(other)):
+                    not (self._codes == other._codes and len(self) == len(other)):
                 return False
-            elif not self.toset().issubset(other.toset()):
+            elif not self._codes <= other._codes:
                 return False
             # check if top and bottom are subsets or can go in the middle
-            bottomMatches: bool = len(other.bottom) == 0 or set(self.bottom).issubset(other.bottom)
-            topMatches: bool = len(other.top) == 0 or set(self.top).issubset(other.top)
+            bottomMatches: bool = len(other.bottom) == 0 or self._bottomCodes <= other._bottomCodes
+            topMatches: bool = len(other.top) == 0 or self._topCodes <= other._topCodes
             return bottomMatches and topMatches
 
         return False
@@ -126,9 +163,11 @@ class Move:
         """Cast to list of cards"""
         return self.bottom + self.middle + self.top
 
-    def toset(self) -> set[Card]:
+    def toset(self) -> frozenset[Card]:
         """Cast to set of cards"""
-        return set(self.tolist())
+        if self._cards is None:
+            self._cards = frozenset(self.tolist())
+        return self._cards
 
 
 '''class MoveChain: # depreciated
@@ -21,6 +21,9 @@ class Player:
     :ivar hand: The list of card in the player's hand
     """
 
+    __slots__ = ('game', 'name', 'index', 'hand', '_moveBuffer', '_topCard', '_legalMoves', '_bufferVersion',
+                 '_continuationCards', '_continuationVersion', '_legalMovesKey')
+
     def __init__(self, name: str, game: Game, index: int, hand: list[Card] = None):
         """
         UNO Player class constructor
@@ -38,6 +41,14 @@ class Player:
         self._topCard: Card = game.discard.get_top()
         self._legalMoves: list[Move] = []
 
+        # cards that can continue the buffered move, cached until the buffer or legal moves change
+        self._bufferVersion: int = 0
+        self._continuationCards: set[Card] = set()
+        self._continuationVersion: int = -1
+
+        # game state the legal moves were last found for
+        self._legalMovesKey: tuple | None = None
+
     def __str__(self):
         return self.name
 
@@ -52,7 +63,7 @@ class Player:
         if isinstance(cards, list):
             self.hand += cards
         else:
-            self.hand += self.game.drawPile.deal(cards)
+            self.game.drawPile.deal_into(self.hand, cards)
 
     def play_buffered_cards(self) -> bool:
         """
@@ -62,6 +73,7 @@ class Player:
         if self.is_move_complete():
             self.game.discard.append(self._moveBuffer)
             self._moveBuffer.clear()
+            self._bufferVersion += 1
             return True
         return False
 
@@ -73,45 +85,40 @@ class Player:
         """
 
         myTurn = self.game.toMove == self.index
-        continuations: list[bool] = []
+        jumpIns = self.game.jumpIns.enabled
 
         if top is None:
             top = self._topCard
 
         # check if we are allowed to play moves right now
-        if not (myTurn or bool(self.game.jumpIns)):
+        if not (myTurn or jumpIns):
             return [False] * len(self.hand)
 
+        # gather every card that can go next, so each card in the hand is checked with a single set lookup
+        legalCards: set[Card] = set()
+
         # check if this is the first card
-        if (not self._moveBuffer) or (bool(self.game.jumpIns) and top == self._moveBuffer[-1]):
-            for card in self.hand:
-                for move in self._legalMoves:
-                    if card in move.first_layer():
-                        continuations.append(True)
-                        break
-                else:
-                    continuations.append(False)
+        moveBuffer = self._moveBuffer
+        if (not moveBuffer) or (jumpIns and top == moveBuffer[-1]):
+            for move in self._legalMoves:
+                legalCards.update(move.first_layer())
+        elif self._continuationVersion == self._bufferVersion:
+            # nothing changed since the last check
+            legalCards = self._continuationCards
         else:
-            # filter moves
-            moves = []
             for move in self._legalMoves:
                 # get the other cards that can/must be in the move
-                reduced = move.without(self._moveBuffer, True)
+                reduced = move.without(moveBuffer, True)
                 # ensure that cards can still be added to the move
                 # and ensure that a top card to complete the move is still present
                 if len(reduced) and bool(move.top) == bool(reduced.top):
-                    moves.append(reduced)
+                    legalCards.update(reduced.tolist())
 
-            # determine which cards can continue the move
-            for card in self.hand:
-                for move in moves:
-                    if card in move:
-                        continuations.append(True)
-                        break
-                else:
-                    continuations.append(False)
+            self._continuationCards = legalCards
+            self._continuationVersion = self._bufferVersion
 
-        return continuations
+        # determine which cards can continue the move
+        return [card in legalCards for card in self.hand]
 
     def is_move_complete(self, start: int = 0, end: int = -1) -> bool:
         """
@@ -121,6 +128,10 @@ class Player:
         :param end: ending index in move buffer
         :return: whether the buffered move is complete as is
         """
+        # nothing to build a move from or compare it against
+        if not (self._legalMoves and self._moveBuffer):
+            return False
+
         move = Move(self._moveBuffer[start:end], bottom=self._moveBuffer[start], top=self._moveBuffer[end])
         return any(map(move.can_replace, self._legalMoves))
 
@@ -129,31 +140,43 @@ class Player:
         Updates stored list of legal moves
         :param top: top card on discard pile
         """
-        myTurn = self.index == self.game.toMove
+        game = self.game
+        myTurn = self.index == game.toMove
         if top is None:
             top = self._topCard
 
-        self._legalMoves.clear()
+        # nothing that affects the legal moves changed since they were last found
+        key = (game.stateVersion, game.toMove, top, len(self.hand))
+        if key == self._legalMovesKey:
+            return
+        self._legalMovesKey = key
+
+        legalMoves = self._legalMoves
+        legalMoves.clear()
+        self._bufferVersion += 1
 
         if myTurn:
             # check if we are under attack and need to stack
-            if bool(self.game.stacking) and self.game.stacking.stackCount:
-                self._legalMoves = self.game.stacking.get_moves(top, self.hand, False)
+            if game.stacking.enabled and game.stacking.stackCount:
+                self._legalMoves = game.stacking.get_moves(top, self.hand, False)
                 return
 
-            # check normal moves
+            # check normal moves. Same check as card & top, without calling Card.__and__ for every card.
+            topColor = top.color
+            topType = top.type
+            topWild = topType.isWild
             for card in self.hand:
-                if card and top:
-                    self._legalMoves.append(Move(card))
-        elif not bool(self.game.jumpIns):
+                cardType = card.type
+                if topWild or cardType.isWild or card.color is topColor or cardType is topType:
+                    legalMoves.append(Move(card))
+        elif not game.jumpIns.enabled:
             # no legal moves if we aren't allowed to play right now, so terminate here
             return
 
         # special moves from rules
-        rules = list(filter(lambda r: isinstance(r, MoveRule) and bool(r), self.game.rules.values()))
-
-        for rule in rules:
-            self._legalMoves.extend(rule.get_moves(top, self.hand, not myTurn))
+        for rule in game.moveRules:
+            if rule.enabled:
+                legalMoves.extend(rule.get_moves(top, self.hand, not myTurn))
 
     def interrupt_move(self) -> None:
         """
@@ -165,7 +188,8 @@ class Player:
         # TODO: improve legality inference
         if self._topCard != newTop and not (self.game.toMove == self.index and (self._moveBuffer[0] and newTop)):
             self.hand += self._moveBuffer
-            self._moveBuffer = []
+            self._moveBuffer.clear()
+            self._bufferVersion += 1
 
         self._topCard = newTop
 
@@ -177,15 +201,17 @@ class Player:
         """
         if isinstance(card, int):
             if -len(self.hand) <= card < len(self.hand):
-                card = self.hand[card]
+                card = self.hand.pop(card)
             else:
                 return False
         else:
-            if card not in self.hand:
+            try:
+                self.hand.remove(card)
+            except ValueError:
                 return False
 
         self._moveBuffer.append(card)
-        self.hand.remove(card)
+        self._bufferVersion += 1
         return True
 
     def pop_buffer(self, numCards: int = 1) -> bool:
@@ -197,10 +223,12 @@ class Player:
         if numCards == -1:
             self.hand.extend(self._moveBuffer)
             self._moveBuffer.clear()
+            self._bufferVersion += 1
             return True
         elif numCards <= len(self._moveBuffer):
             for _ in range(numCards):
                 self.hand.append(self._moveBuffer.pop())
+            self._bufferVersion += 1
             return True
         return False
 
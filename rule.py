@@ -1,16 +1,23 @@
 import itertools
 from abc import ABC, abstractmethod
+from typing import Iterable
 from game import Game
 from deck import Deck
 from card import Card
 from player import Player
 from move import Move
 
-# for silent sixes to detect talking
-import tensorflow as tf
-from tensorflow import keras
 
-import itertools as itt
+def _unwrap(discard: Deck | Card, hand: Player | list[Card]) -> tuple[Card, list[Card]]:
+    """
+    Converts the arguments of ``MoveRule.get_moves`` to the top card and a list of cards
+    :param discard: discard pile or the top card
+    :param hand: the player whose hand we're checking or their hand itself
+    :return: the top card and the list of cards in the hand
+    """
+    top = discard.get_top() if type(discard) is Deck else discard
+    cards = hand.hand if type(hand) is Player else hand
+    return top, cards
 
 
 class Rule(ABC):
@@ -20,6 +27,8 @@ class Rule(ABC):
     :ivar bool enabled = False: whether the rule is enabled
     """
 
+    __slots__ = ('enabled',)
+
     def __init__(self):
         """
         Total Chaos Rule abstract class constructor
@@ -44,6 +53,8 @@ class MoveRule(Rule, ABC):
     A rule that affects what cards are playable
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def get_moves(self, discard: Deck | Card, hand: list[Card] | Player, duplicate: bool = False) -> list[Move]:
         """
@@ -60,6 +71,8 @@ class ActionRule(Rule, ABC):
     A rule that affects actions in the game
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def update(self, *args, **kwargs) -> None:
         """
@@ -97,6 +110,8 @@ class Stacking(MoveRule, ActionRule):
     :ivar int stackCount: number of cards that will be drawn when the stack ends
     """
 
+    __slots__ = ('conditions', 'stackCount')
+
     def __init__(self, conditions: set[str]):
         """
         Stacking class constructor
@@ -105,7 +120,7 @@ class Stacking(MoveRule, ActionRule):
         super().__init__()
         self.conditions = conditions
         self.stackCount = 0
-        self.enabled = bool(len(conditions))
+        self.enabled = bool(conditions)
 
     def get_moves(self, discard: Deck | Card, hand: Player | list[Card], duplicate: bool = False) -> list[Move]:
         """
@@ -117,16 +132,10 @@ class Stacking(MoveRule, ActionRule):
         """
         # make sure a stack exists
         if self.stackCount and self.enabled:
-            # get top card
-            if isinstance(discard, Deck):
-                top = discard.get_top()
-            else:
-                top = discard
+            top, hand = _unwrap(discard, hand)
 
-            if isinstance(hand, Player):
-                hand = hand.hand
-
-            return list(map(Move, filter(lambda card: self.can_stack(top, card), hand)))
+            canStack = self.can_stack
+            return [Move(card) for card in hand if canStack(top, card)]
 
         return []
 
@@ -143,15 +152,17 @@ class Stacking(MoveRule, ActionRule):
         else:
             top = discard
 
+        conditions = self.conditions
+
         if duplicate:
             if card.is_dupe(top):
                 return True
         elif card.type.drawAmount > 0:
-            if (card and top) and 'draw any' in self.conditions:  # any valid draw card on a draw card
+            if (card & top) and 'draw any' in conditions:  # any valid draw card on a draw card
                 return True
-            elif card.type == top.type and 'draw same' in self.conditions:  # when +2s and +4s cannot mix
+            elif card.type is top.type and 'draw same' in conditions:  # when +2s and +4s cannot mix
                 return True
-        elif card in self.conditions and (card and top):
+        elif (card.color.name in conditions or card.type.name in conditions) and (card & top):
             # card is stackable, and it can go on the top card
             return True
 
@@ -163,24 +174,30 @@ class Stacking(MoveRule, ActionRule):
         :param discard: discard pile
         :param cardsPlayed: number of cards played last turn
         """
-        self.enabled = bool(len(self.conditions))
-
+        # stacking cards keep enabled in sync with the conditions
         if not self.enabled:
             return
 
-        newCards = discard[-cardsPlayed:]
-
-        # add stuff to the stack
-        for card in newCards:
-            if self.can_stack(discard, card):
-                self.stackCount += card.type.drawAmount
+        top = discard.get_top()
+        cards = discard.cards
+        numCards = len(cards)
+        canStack = self.can_stack
+        stackCount = self.stackCount
+
+        # add stuff to the stack, indexing the newly played cards instead of slicing them off
+        for i in range(max(numCards - cardsPlayed, 0), numCards):
+            card = cards[i]
+            if canStack(top, card):
+                stackCount += card.type.drawAmount
             else:
                 # the stack was ended because someone did something illegal
-                if self.stackCount > 0:
+                if stackCount > 0:
                     print("Someone did something illegal on a stack")
-                self.stackCount = 0
+                stackCount = 0
                 break
 
+        self.stackCount = stackCount
+
     def flush(self, player: Player, attackMultiplier: float | AttackMultiplier = 1) -> None:
         """
         Empties the stack and makes the player draw.
@@ -204,15 +221,19 @@ class SlapJacks(ActionRule):
     Players who slap incorrectly or fail to slap are also penalized 2 cards.
 
     :ivar int numPlayers: number of players in the game
-    :ivar list[int] slapped: list of the indices of the players who have slapped
+    :ivar int slapped: bitmask of the indices of the players who have slapped
+    :ivar int numSlapped: number of players who have slapped
     :ivar bool shouldSlap: if the players should slap the deck
     :ivar bool enabled: if the rule is enabled
     """
 
+    __slots__ = ('numPlayers', 'slapped', 'numSlapped', 'shouldSlap')
+
     def __init__(self, numPlayers: int):
         super().__init__()
         self.numPlayers = numPlayers
-        self.slapped: list[int] = []
+        self.slapped: int = 0
+        self.numSlapped: int = 0
         self.shouldSlap: bool = False
 
     def slap(self, player: Player) -> None:
@@ -222,8 +243,13 @@ class SlapJacks(ActionRule):
         """
         if self.enabled:
             if self.shouldSlap:
-                self.slapped.append(player.index)
-                if len(self.slapped) == self.numPlayers:
+                playerBit = 1 << player.index
+                if self.slapped & playerBit:
+                    # already slapped
+                    return
+                self.slapped |= playerBit
+                self.numSlapped += 1
+                if self.numSlapped == self.numPlayers:
                     # this is the last player to slap, so they draw 2
                     player.draw(2)
             else:
@@ -239,15 +265,16 @@ class SlapJacks(ActionRule):
         if not self.enabled:
             return
 
-        if self.slapped and self.shouldSlap:
-            # at least one person slapped
-            for i, player in enumerate(players):
-                if player.index not in self.slapped:
+        if self.slapped and self.shouldSlap and self.numSlapped < self.numPlayers:
+            # at least one person slapped, but not everyone
+            for player in players:
+                if not self.slapped >> player.index & 1:
                     # punish the players who failed to slap
-                    players[i].draw(2)
+                    player.draw(2)
 
         # reset for next turn
-        self.slapped = []
+        self.slapped = 0
+        self.numSlapped = 0
         self.shouldSlap = discard.top_sum() == 10
 
 
@@ -264,7 +291,7 @@ class SwappyZero(ActionRule):
         :param game: the game of UNO being played
         """
 
-        if self.enabled and game.discard.get_top().type == '0':
+        if self.enabled and game.discard.get_top().type.value == 0:
             game.cycle_hands()
 
 
@@ -280,7 +307,7 @@ class SwappySeven(ActionRule):
         Check if the top card is a 7 and have the player pick a player to trade hands with if so
         :param game: UNO Game being played
         """
-        if self.enabled and game.discard.get_top().type == '7':
+        if self.enabled and game.discard.get_top().type.value == 7:
             # TODO: Implement method to choose someone's hand to take
             game.trade_hands(game.toMove, int(input("Who's hand do you want? ")))
 
@@ -288,6 +315,8 @@ class SwappySeven(ActionRule):
 class MathRules(MoveRule):
     """Math Rules: you use math to play 2 cards at once"""
 
+    __slots__ = ('addition', 'subtraction')
+
     def __init__(self, addition: bool = False, subtraction: bool = False):
         """
         Math Rules class constructor
@@ -307,50 +336,57 @@ class MathRules(MoveRule):
         :param duplicate: whether both cards must match the color of the top card
         :return: list of the pairs of cards in the player's hand that add up to the top card
         """
-        self.enabled = self.addition or self.subtraction
-        super().get_moves(discard, hand)
-
-        top = discard.get_top() if isinstance(discard, Deck) else discard
-        topName = top.type.name
+        top, hand = _unwrap(discard, hand)
 
         # make sure that the top card is a number card
-        if not topName.isdigit():
+        if not top.type.isNumber:
             return []
 
-        # convert hand to a list of cards
-        if isinstance(hand, Player):
-            hand = hand.hand
-
-        # filter the player's hand for number cards
-        numberCards = list(filter(lambda card: card.type.name.isdigit(), hand))
+        # the value of the top card
+        value = top.type.value
 
-        # filter the player's hand by color if necessary
-        if duplicate:
-            numberCards = list(filter(lambda card: card.color == top.color, hand))
+        # group the player's number cards by value, filtering by color if necessary
+        cardsByValue: list[list[Card]] = [[] for _ in range(10)]
+        topColor = top.color
+        for card in hand:
+            cardType = card.type
+            if cardType.isNumber and (not duplicate or card.color is topColor):
+                cardsByValue[cardType.value].append(card)
 
-        # cannot do math with <2 cards
-        if len(numberCards) < 2:
-            return []
+        mathPairs = []
 
-        # the value of the top card
-        value = int(topName)
+        # only look at the values that can make the top card instead of checking every pair of cards
+        for value1, cards1 in enumerate(cardsByValue):
+            if not cards1:
+                continue
 
-        mathPairs = []
+            if self.addition and value1 <= value - value1:
+                for card1, card2 in self._pairs(cards1, cardsByValue[value - value1], value1 == value - value1):
+                    mathPairs.append(Move([card1, card2], enforceMatch=True))
 
-        for card1, card2 in itertools.combinations(numberCards, 2):
-            if self.addition and card1 + card2 == value:
-                mathPairs.append(Move([card1, card2], enforceMatch=True))
-            elif self.subtraction and abs(card1 - card2) == value:
-                if value:  # non-zero difference
-                    # smaller value below the bigger value for subtraction
-                    if card1 < card2:
+            # pairs with a 0 that make the value were already added by addition
+            if self.subtraction and value1 + value <= 9 and not (self.addition and value1 == 0):
+                for card1, card2 in self._pairs(cards1, cardsByValue[value1 + value], value == 0):
+                    if value:  # non-zero difference
+                        # smaller value below the bigger value for subtraction
                         mathPairs.append(Move(None, bottom=card1, top=card2, enforceMatch=True))
-                    else:
-                        mathPairs.append(Move(None, bottom=card2, top=card1, enforceMatch=True))
-                else:  # both cards have equal value
-                    mathPairs.append(Move([card1, card2], enforceMatch=True))
+                    else:  # both cards have equal value
+                        mathPairs.append(Move([card1, card2], enforceMatch=True))
+
         return mathPairs
 
+    @staticmethod
+    def _pairs(cards1: list[Card], cards2: list[Card], sameValue: bool) -> Iterable[tuple[Card, Card]]:
+        """
+        :param cards1: cards with the first value
+        :param cards2: cards with the second value
+        :param sameValue: whether both lists are the same group of cards
+        :return: every pair of different cards with one card from each list
+        """
+        if sameValue:
+            return itertools.combinations(cards1, 2)
+        return itertools.product(cards1, cards2)
+
 
 class Depleters(MoveRule):
     """
@@ -367,10 +403,15 @@ class Depleters(MoveRule):
         :ivar list[Card] nines = []: list of nine-cards
         :ivar list[Card] cards = []: list of other cards
         """
+        __slots__ = ('nines', 'cards', '_lists')
+
         def __init__(self):
             self.nines: list[Card] = []
             self.cards: list[Card] = []
 
+            # indexed by whether a card is a nine
+            self._lists: tuple[list[Card], list[Card]] = (self.cards, self.nines)
+
         def to_move(self) -> Move:
             """
             :return: Casts to `Move` object
@@ -388,10 +429,7 @@ class Depleters(MoveRule):
             Appends a card to the group
             :param card: the card being added
             """
-            if card == '9':
-                self.nines.append(card)
-            else:
-                self.cards.append(card)
+            self._lists[card.type.value == 9].append(card)
 
     def get_moves(self, discard: Deck | Card, hand: Player | list[Card], duplicate: bool = False) -> list[Move]:
         """
@@ -405,38 +443,39 @@ class Depleters(MoveRule):
         if not self.enabled:
             return []
 
-        top = discard.get_top() if isinstance(discard, Deck) else discard
+        top, hand = _unwrap(discard, hand)
+
+        # every depleter needs a nine, so don't bother grouping a hand without one
+        nine = Card.NUMBER_CARDS['9']
+        if not any(card.type is nine for card in hand):
+            return []
 
-        # set up color groups
-        colorCards: dict[str: Depleters.ColorGroup] = dict()
+        # set up color groups, indexed like Card.COLORS. Wild cards (index 0) never get a group.
+        colorGroups: list[Depleters.ColorGroup | None] = [None] * len(Card.COLORS)
 
-        isNine: bool = top.type != '9'
+        isNine: bool = top.type.value == 9
 
         if duplicate and not isNine:
             return []
         elif duplicate or not isNine:
-            colorCards[top.color.name] = Depleters.ColorGroup()
+            topIndex = Card.COLOR_INDICES[top.color.name]
+            if topIndex:
+                colorGroups[topIndex] = Depleters.ColorGroup()
         else:
-            colorCards = {
-                'red': Depleters.ColorGroup(),
-                'yellow': Depleters.ColorGroup(),
-                'green': Depleters.ColorGroup(),
-                'blue': Depleters.ColorGroup()
-            }
-
-        # convert hand to a list of Cards
-        if isinstance(hand, Player):
-            hand = hand.hand
+            for i in range(1, len(colorGroups)):
+                colorGroups[i] = Depleters.ColorGroup()
 
         # filter cards by color
+        colorIndices = Card.COLOR_INDICES
         for card in hand:
-            if card != 'wild' and card.color in colorCards:
-                colorCards[card.color.name].append(card)
+            group = colorGroups[colorIndices[card.color.name]]
+            if group is not None and not card.type.isWild:
+                group.append(card)
 
         # get valid depleter moves
         depleters: list[Move] = []
-        for _, group in colorCards:
-            if group.has_nines():
+        for group in colorGroups:
+            if group is not None and group.has_nines():
                 depleters.append(group.to_move())
 
         return depleters
@@ -452,7 +491,7 @@ class Revive(ActionRule):
     """
 
     def update(self, *args, **kwargs) -> None:
-        super().update()
+        pass
 
 
 class DrawToPlay(ActionRule):
@@ -461,7 +500,7 @@ class DrawToPlay(ActionRule):
     """
 
     def update(self, *args, **kwargs) -> None:
-        super().update()
+        pass
 
 
 class SilentSixes(ActionRule):
@@ -470,10 +509,24 @@ class SilentSixes(ActionRule):
     talk, even if calling uno.
 
     Will probably use microphone + voice isolation + volume threshold to determine when someone is talking.
+
+    :ivar _tf: the tensorflow module used to detect talking, imported the first time silent sixes is in play
     """
 
+    __slots__ = ('_tf',)
+
+    def __init__(self):
+        super().__init__()
+        self._tf = None
+
     def update(self, *args, **kwargs) -> None:
-        pass
+        if not self.enabled:
+            return
+
+        # tensorflow is slow to import and heavy in memory, so only load it once the rule is actually used
+        if self._tf is None:
+            import tensorflow as tf
+            self._tf = tf
 
 
 class JumpIns(MoveRule, ActionRule):
@@ -492,16 +545,10 @@ class JumpIns(MoveRule, ActionRule):
         if not (self.enabled and duplicate):
             return []
 
-        # hand becomes list of cards
-        if isinstance(hand, Player):
-            hand = hand.hand
-
-        # discard becomes top card
-        if isinstance(discard, Deck):
-            discard = discard.get_top()
+        top, hand = _unwrap(discard, hand)
 
         # filter hand for cards that are duplicates of the top card
-        return list(map(Move, filter(lambda card: card.is_dupe(discard), hand)))
+        return [Move(card) for card in hand if card.code == top.code]
 
     def update(self, player: Player | int, game: Game) -> None:
         """
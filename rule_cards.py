@@ -17,10 +17,15 @@ class RuleCard:
     """
     Rule Card object class
 
+    :cvar bool isSlot: whether this rule deck entry is an extra rule slot. Always ``False`` for rule cards.
     :ivar bool isActive: whether the rule is active
     :ivar str ruleName: name of the rule
     """
 
+    __slots__ = ('_game', 'isActive', 'ruleName')
+
+    isSlot = False
+
     def __init__(self, game: Game, ruleName: str, isActive: bool = False):
         """
 
@@ -40,6 +45,10 @@ class RuleCard:
         """
         return self.ruleName == other.ruleName
 
+    def __hash__(self):
+        # consistent with __eq__, which compares rule names
+        return hash(self.ruleName)
+
     def set_active(self, isActive: bool, slot: RuleSlot, **kwargs) -> None:
         """
         Activates or deactivates the rule card
@@ -62,6 +71,8 @@ class StackingCard(RuleCard):
     :ivar bool isActive: whether the rule is active
     """
 
+    __slots__ = ('condition', '_stacking', '_conditions')
+
     def __init__(self, game: Game, ruleName: str, condition: str, isActive: bool = False):
         """
 
@@ -75,13 +86,18 @@ class StackingCard(RuleCard):
         """
         super().__init__(game, ruleName, isActive)
         self.condition = condition
+        self._stacking: Stacking = game.stacking
+        # the conditions set is only ever updated in place
+        self._conditions: set[str] = game.stacking.conditions
 
     def set_active(self, isActive: bool, slot: RuleSlot, **kwargs) -> None:
         self.isActive = isActive
+        conditions = self._conditions
         if isActive:
-            self._game.stacking.conditions.add(self.condition)
+            conditions.add(self.condition)
         else:
-            self._game.stacking.conditions.discard(self.condition)
+            conditions.discard(self.condition)
+        self._stacking.enabled = bool(conditions)
 
 
 class MathCard(RuleCard):
@@ -92,14 +108,19 @@ class MathCard(RuleCard):
     :ivar bool isActive: whether the rule is active
     """
 
+    __slots__ = ('operation', '_mathRules')
+
     def __init__(self, game: Game, ruleName: str, operation: str, isActive: bool = False):
         super().__init__(game, ruleName, isActive)
         assert operation == 'addition' or operation == 'subtraction'
         self.operation: str = operation
+        self._mathRules: MathRules = game.mathRules
 
     def set_active(self, isActive: bool, slot: RuleSlot, **kwargs) -> None:
         self.isActive = isActive
-        setattr(self._game.mathRules, self.operation, isActive)
+        mathRules = self._mathRules
+        setattr(mathRules, self.operation, isActive)
+        mathRules.enabled = mathRules.addition or mathRules.subtraction
 
 
 class MultiplierCard(RuleCard):
@@ -110,6 +131,8 @@ class MultiplierCard(RuleCard):
     :ivar bool isActive: whether the rule is active
     """
 
+    __slots__ = ('multiplier', '_attackMultiplier')
+
     def __init__(self, game: Game, ruleName: str, multiplier: float, isActive: bool = False):
         """
 
@@ -120,18 +143,21 @@ class MultiplierCard(RuleCard):
         """
         super().__init__(game, ruleName, isActive)
         self.multiplier: float = multiplier
+        self._attackMultiplier: AttackMultiplier = game.attackMultiplier
 
     def set_active(self, isActive: bool, slot: RuleSlot, **kwargs) -> None:
         if isActive and not self.isActive:
-            self._game.attackMultiplier.multiplier *= self.multiplier
+            self._attackMultiplier.multiplier *= self.multiplier
         elif not isActive and self.isActive:
-            self._game.attackMultiplier.multiplier /= self.multiplier
+            self._attackMultiplier.multiplier /= self.multiplier
         self.isActive = isActive
 
 
 class ReviveCard(RuleCard):
     """Rule card for slot and discard revives"""
 
+    __slots__ = ('_isSlotRevive',)
+
     def __init__(self, game: Game, mode: str = 'slot', isActive: bool = False):
         """
 
@@ -143,13 +169,27 @@ class ReviveCard(RuleCard):
         self._isSlotRevive = mode == 'slot'
 
     def set_active(self, isActive: bool, slot: RuleSlot, **kwargs) -> None:
+        """
+        Activates or deactivates the revive card, reviving a rule card when it is activated
+        :param isActive: whether the rule should be active (True) or inactive (False)
+        :param slot: the slot the rule is placed in
+        :keyword int reviveIndex: index of the rule card to revive. Leave out to ask the game's rule chooser, or the
+        player if the game has none.
+        """
         super().set_active(isActive, slot)
+        if not isActive:
+            return
 
         sourceSlot = slot if self._isSlotRevive else self._game.ruleDiscard
 
-        # TODO: get choice of rule card from GUI input
-        ruleIndex = int(input("Enter index of rule in slot: "))  # TEMPORARY
-        sourceSlot.revive(ruleIndex, slot)
+        ruleIndex = kwargs.get('reviveIndex')
+        if ruleIndex is None:
+            if self._game.ruleChooser is not None:
+                ruleIndex = self._game.ruleChooser(sourceSlot)
+            else:
+                # TODO: get choice of rule card from GUI input
+                ruleIndex = int(input("Enter index of rule in slot: "))  # TEMPORARY
+        sourceSlot.revive_index(ruleIndex, slot)
 
 
 class TotalChaosCard(RuleCard):
@@ -159,8 +199,13 @@ class TotalChaosCard(RuleCard):
     :ivar int lives: number of remaining lives. Each time a rule addition card is played, it can either add or remove lives from the total chaos card.
     :ivar str ruleName = 'total chaos': the name of the total chaos rule card is ``'total chaos'``
     :ivar bool isActive: whether total chaos is activated
+    :cvar frozenset[str] STACKING_CONDITIONS: stacking conditions in effect during total chaos
     """
 
+    __slots__ = ('lives', '_allRules')
+
+    STACKING_CONDITIONS = frozenset({'reverse', 'skip', 'draw any'})
+
     def __init__(self, game: Game, isActive: bool = False):
         """
 
@@ -169,29 +214,32 @@ class TotalChaosCard(RuleCard):
         """
         super().__init__(game, 'total chaos', isActive)
         self.lives: int = 3
+        self._allRules: tuple[Rule, ...] = tuple(game.rules.values())
 
     def set_active(self, isActive: bool, slot: RuleSlot, **kwargs) -> None:
         if isActive and not self.isActive:
             self.isActive = True
             self.lives = 3
-            for _, rule in self._game.rules:
+            for rule in self._allRules:
                 rule.set_active(True)
 
             # special rules
             self._game.mathRules.addition = True
             self._game.mathRules.subtraction = True
-            self._game.stacking.conditions = {'reverse', 'skip', 'draw any'}
+            # update the conditions in place, since stacking cards hold on to the stacking rule
+            conditions = self._game.stacking.conditions
+            conditions.clear()
+            conditions.update(TotalChaosCard.STACKING_CONDITIONS)
             self._game.attackMultiplier.multiplier = 1
             self._game.totalChaos = True
 
             # reset rule slots
             # using Game.discard_slot for animations
-            i: int = 0
-            for _slot in self._game.ruleSlots[:]:
-                if _slot != slot:
+            # walk backwards so discarding a slot doesn't shift the ones still to be checked
+            ruleSlots = self._game.ruleSlots
+            for i in range(len(ruleSlots) - 1, -1, -1):
+                if ruleSlots[i] is not slot:
                     self._game.discard_slot(i)
-                else:
-                    i += 1
 
         elif self.isActive:
             self.lives += 1 if isActive else -1
@@ -217,6 +265,8 @@ class TotalChaosCard(RuleCard):
 class SlotRemover(RuleCard):
     """Discards the slot the card is played on"""
 
+    __slots__ = ()
+
     def __init__(self, game: Game, isActive: bool = False):
         """
 
@@ -5,10 +5,16 @@ class RuleSlot:
     """
     A slot for rule cards, and the rule cards it holds.
 
+    :cvar bool isSlot: whether this rule deck entry is an extra rule slot. Always ``True`` for rule slots.
     :ivar list[RuleCard] ruleCards: list of rule cards in the slot
     :ivar bool topActive: whether to activate the top rule.
+    :ivar list[str] _names: names of the rule cards in the slot, kept in the same order as ``ruleCards``
     """
 
+    __slots__ = ('ruleCards', 'topActive', '_names')
+
+    isSlot = True
+
     def __init__(self, ruleCards: list[RuleCard] | None = None, topActive: bool = True):
         """
 
@@ -17,23 +23,30 @@ class RuleSlot:
         """
         self.ruleCards = [] if ruleCards is None else ruleCards
         self.topActive = topActive
+        self._names: list[str] = [card.ruleName for card in self.ruleCards]
 
-        for i in range(len(ruleCards)):
-            self.ruleCards[i].set_active(False)
+        # only the top card can be active, so only cards that are still active need turning off
+        for card in self.ruleCards[:-1]:
+            if card.isActive:
+                card.set_active(False, self)
 
-        self.ruleCards[-1].set_active(topActive)
+        if self.ruleCards:
+            self.ruleCards[-1].set_active(topActive, self)
 
     def __eq__(self, other) -> bool:
         """
         :type other: RuleSlot
         """
-        return len(self) == len(other) and all(map(RuleCard.__eq__, self.ruleCards, other.ruleCards))
+        if not isinstance(other, RuleSlot):
+            return NotImplemented
+        return self._names == other._names
 
     def __len__(self):
         return len(self.ruleCards)
 
     def __contains__(self, item: RuleCard) -> bool:
-        return item in self.ruleCards
+        # rule cards are equal when their names are
+        return item.ruleName in self._names
 
     def __getitem__(self, i: int) -> RuleCard:
         """Get rule card at index i"""
@@ -42,6 +55,7 @@ class RuleSlot:
     def __setitem__(self, i: int, v: RuleCard):
         """Set rule card at index i to v"""
         self.ruleCards[i] = v
+        self._names[i] = v.ruleName
 
     def __add__(self, other):
         """
@@ -49,29 +63,48 @@ class RuleSlot:
         :type other: RuleSlot | RuleCard
         :rtype: RuleSlot
         """
-        self.ruleCards[-1].set_active(False, self)
+        if self.ruleCards:
+            self.ruleCards[-1].set_active(False, self)
+
         if isinstance(other, RuleCard):
-            slot2 = RuleSlot(self.ruleCards[:])
-            slot2.append(other)
-            return slot2
+            return RuleSlot._from_cards(self.ruleCards + [other], self._names + [other.ruleName], self.topActive)
+        return RuleSlot._from_cards(self.ruleCards + other.ruleCards, self._names + other._names, self.topActive)
+
+    @classmethod
+    def _from_cards(cls, ruleCards: list[RuleCard], names: list[str], topActive: bool):
+        """
+        Builds a slot from cards that are already inactive, except possibly the top one
+        :param ruleCards: rule cards in the new slot
+        :param names: names of the rule cards, in the same order
+        :param topActive: whether to activate the top rule
+        :rtype: RuleSlot
+        """
+        slot = cls.__new__(cls)
+        slot.ruleCards = ruleCards
+        slot.topActive = topActive
+        slot._names = names
 
-        return RuleSlot(self.ruleCards + other.ruleCards)
+        if ruleCards:
+            ruleCards[-1].set_active(topActive, slot)
+        return slot
 
-    def append(self, ruleCard: RuleCard) -> None:
+    def append(self, ruleCard: RuleCard, **kwargs) -> None:
         """
         Appends a new rule card to the top of the slot and activates it if needed.
         Deactivates the previous top rule card.
         :param ruleCard: new rule card to add
+        :param kwargs: extra arguments for the new rule card's ``set_active``, e.g. ``reviveIndex``
         """
 
         # deactivate top rule
         if self.ruleCards:
-            self.ruleCards[-1].set_active(False)
+            self.ruleCards[-1].set_active(False, self)
 
         # activate new rule
         self.ruleCards.append(ruleCard)
+        self._names.append(ruleCard.ruleName)
 
-        self.ruleCards[-1].set_active(self.topActive)
+        ruleCard.set_active(self.topActive, self, **kwargs)
 
     def pop(self, ruleCard: int | RuleCard = -1) -> None:
         """
@@ -79,9 +112,25 @@ class RuleSlot:
         :param ruleCard: rule card being removed or its index in the slot
         """
         if isinstance(ruleCard, int):
-            self.ruleCards.pop(ruleCard)
+            self.pop_index(ruleCard)
         else:
-            self.ruleCards.remove(ruleCard)
+            self.pop_card(ruleCard)
+
+    def pop_index(self, i: int = -1) -> None:
+        """
+        Removes the rule card at an index from the slot
+        :param i: index of the rule card in the slot
+        """
+        self.ruleCards.pop(i)
+        self._names.pop(i)
+
+    def pop_card(self, ruleCard: RuleCard) -> None:
+        """
+        Removes a rule card from the slot
+        :param ruleCard: rule card being removed
+        """
+        self.ruleCards.remove(ruleCard)
+        self._names.remove(ruleCard.ruleName)
 
     def revive(self, ruleCard: RuleCard | int, targetSlot='self') -> None:
         """
@@ -90,16 +139,42 @@ class RuleSlot:
         :param targetSlot: slot receiving the revived card. leave as ``'self'`` to make this slot receive the card.
         :type targetSlot: RuleSlot | str
         """
-
-        # get the rule card itself
         if isinstance(ruleCard, int):
-            ruleCard = self.ruleCards[ruleCard]
+            self.revive_index(ruleCard, targetSlot)
+        else:
+            self.revive_card(ruleCard, targetSlot)
 
-        # rearrange
-        self.ruleCards.remove(ruleCard)
+    def _revive_target(self, targetSlot):
+        """
+        Resolves the slot receiving a revived card
+        :param targetSlot: a rule slot, or ``'self'`` for this slot
+        :type targetSlot: RuleSlot | str
+        :rtype: RuleSlot
+        """
+        # check the type so the 'self' sentinel never goes through RuleSlot.__eq__
+        return self if isinstance(targetSlot, str) else targetSlot
 
-        if targetSlot == 'self':
-            self.append(ruleCard)
-        else:
-            targetSlot.append(ruleCard)
+    def revive_index(self, i: int, targetSlot='self') -> None:
+        """
+        Revives the rule card at an index in the slot.
+        :param i: index of the rule card in the slot
+        :param targetSlot: slot receiving the revived card. leave as ``'self'`` to make this slot receive the card.
+        :type targetSlot: RuleSlot | str
+        """
+        # pop by index, so the card that was picked is moved and not the first card sharing its name
+        ruleCard = self.ruleCards.pop(i)
+        self._names.pop(i)
+
+        self._revive_target(targetSlot).append(ruleCard)
+
+    def revive_card(self, ruleCard: RuleCard, targetSlot='self') -> None:
+        """
+        Revives a rule card in the slot.
+        :param ruleCard: the rule card to be revived
+        :param targetSlot: slot receiving the revived card. leave as ``'self'`` to make this slot receive the card.
+        :type targetSlot: RuleSlot | str
+        """
+        # rearrange
+        self.pop_card(ruleCard)
 
+        self._revive_target(targetSlot).append(ruleCard)